@@ -7,14 +7,22 @@ Page 3: CPU and Network usage graphs
 Use - and + buttons to navigate pages
 """
 
+import os
 import time
 import socket
+import selectors
+import functools
 import psutil
-import subprocess
 from datetime import datetime
-from collections import deque
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
+# Numba is optional, without it the framebuffer is packed with NumPy
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
 try:
     import gfxhat
     from gfxhat import touch, lcd, backlight, fonts
@@ -31,9 +39,27 @@ HEIGHT = 64
 current_page = 0
 total_pages = 3
 
+# Seconds between refreshes for each page: the clock ticks every second
+# (aligned to the wall clock), disk/RAM totals move slowly, graphs take
+# one sample per refresh
+PAGE_REFRESH_SECONDS = [1.0, 10.0, 1.0]
+
+# Button callbacks write to this pipe to wake the main loop
+wake_read, wake_write = os.pipe()
+os.set_blocking(wake_read, False)
+
+# How long the local IP stays cached (address changes also invalidate it)
+IP_CACHE_SECONDS = 60
+RTMGRP_IPV4_IFADDR = 0x10
+ip_cache = (0.0, None)
+
 # Copyparty port
 COPYPARTY_PORT = 8080
 
+# How long a copyparty status check stays valid
+COPYPARTY_CHECK_SECONDS = 10
+copyparty_cache = (0.0, False)
+
 # Backlight color - White (adjust brightness by changing all values equally)
 # Full brightness: (255, 255, 255)
 # 75% brightness: (190, 190, 190)
@@ -44,58 +70,163 @@ BACKLIGHT_COLOR = (190, 190, 190)  # Dimmed white (25% brightness)
 
 # Font size
 FONT_SIZE = 12
+SMALL_FONT_SIZE = 8
+
+# Fonts are loaded once, not on every refresh
+try:
+    FONT = ImageFont.truetype(fonts.BitbuntuFull, FONT_SIZE)
+    SMALL_FONT = ImageFont.truetype(fonts.BitbuntuFull, SMALL_FONT_SIZE)
+except Exception:
+    FONT = ImageFont.load_default()
+    SMALL_FONT = FONT
+
+# ST7567 commands
+ST7567_SETPAGESTART = 0xb0
+ST7567_SETCOLL = 0x00
+ST7567_SETCOLH = 0x10
+
+# Static labels per page: (position, text, uses small font)
+PAGE_LABELS = [
+    [((2, 2), "IP: ", False), ((2, 18), "Copyparty: ", False)],
+    [((2, 2), "SD: ", False), ((2, 18), "NVMe: ", False), ((2, 50), "RAM: ", False)],
+    [((2, 0), "CPU ", True), ((2, 34), "NET ", True)],
+]
+
+# Graph areas on page 3: (y_start, height)
+CPU_GRAPH = (12, 20)
+NET_GRAPH = (46, 18)
 
-# Graph data storage (keep last 64 points for full width)
-cpu_history = deque([0] * WIDTH, maxlen=WIDTH)
-net_history = deque([0] * WIDTH, maxlen=WIDTH)
-last_net_io = None
+# Pre-rendered page backgrounds and the x position right after each label
+page_backgrounds = []
+label_ends = {}
+
+# Packed background of page 3, which is drawn without PIL
+graph_page_framebuffer = b''
+
+# One render function per page, returning its packed framebuffer
+page_renderers = []
+
+# Framebuffer last pushed to the LCD (None forces a full refresh)
+last_framebuffer = None
+
+# Graph data storage: ring buffers of percentages, one sample per column.
+# history_head is the slot the next sample goes into (the oldest one).
+cpu_history = np.zeros(WIDTH, dtype=np.uint8)
+net_history = np.zeros(WIDTH, dtype=np.uint8)
+history_head = 0
+last_cpu_times = None
+
+# Hot metrics are read straight from /proc; the files stay open and are
+# re-read from the start on every sample (unbuffered so reads are fresh)
+proc_stat = open('/proc/stat', 'rb', buffering=0)
+proc_meminfo = open('/proc/meminfo', 'rb', buffering=0)
+proc_net_dev = open('/proc/net/dev', 'rb', buffering=0)
+
+class NetState:
+    """Last network counters sample, updated in place"""
+    __slots__ = ('sent', 'recv', 'time')
+    
+    def __init__(self):
+        self.sent = 0
+        self.recv = 0
+        self.time = None
+
+last_net_io = NetState()
+
+# Disk capacity changes slowly, so statvfs results are reused for a while
+DISK_CACHE_SECONDS = 30
+disk_cache = {}
+
+def open_address_watch():
+    """Subscribe to IPv4 address change events over netlink"""
+    try:
+        s = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, socket.NETLINK_ROUTE)
+        s.bind((0, RTMGRP_IPV4_IFADDR))
+        s.setblocking(False)
+        return s
+    except Exception:
+        return None
+
+address_watch = open_address_watch()
+
+def address_changed():
+    """Drain pending netlink events, True if any address changed"""
+    if address_watch is None:
+        return False
+    changed = False
+    while True:
+        try:
+            address_watch.recv(4096)
+        except OSError:
+            return changed
+        changed = True
 
 def get_local_ip():
-    """Get the local IP address"""
+    """Get the local IP address (cached for IP_CACHE_SECONDS)"""
+    global ip_cache
+    
+    now = time.monotonic()
+    checked_at, ip = ip_cache
+    if ip is not None and not address_changed() and now - checked_at < IP_CACHE_SECONDS:
+        return ip
+    
     try:
         s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         s.settimeout(2)  # 2 second timeout
         s.connect(("8.8.8.8", 80))
         ip = s.getsockname()[0]
         s.close()
-        return ip
     except Exception:
-        return "No network"
+        ip = "No network"
+    ip_cache = (now, ip)
+    return ip
 
 def is_copyparty_running():
-    """Check if copyparty is running"""
+    """Check if copyparty is running by probing its port on localhost"""
+    global copyparty_cache
+    
+    now = time.monotonic()
+    checked_at, running = copyparty_cache
+    if checked_at and now - checked_at < COPYPARTY_CHECK_SECONDS:
+        return running
+    
     try:
-        result = subprocess.run(
-            ['systemctl', 'is-active', 'copyparty'],
-            capture_output=True,
-            text=True,
-            timeout=2
-        )
-        if result.stdout.strip() == 'active':
-            return True
-        
-        result = subprocess.run(
-            ['pgrep', '-f', 'copyparty'],
-            capture_output=True,
-            text=True,
-            timeout=2
-        )
-        return len(result.stdout.strip()) > 0
+        s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        s.settimeout(0.05)
+        running = s.connect_ex(("127.0.0.1", COPYPARTY_PORT)) == 0
+        s.close()
     except Exception:
-        return False
+        running = False
+    copyparty_cache = (now, running)
+    return running
 
 def get_disk_usage(path):
-    """Get disk usage for a path"""
+    """Get disk usage for a path (cached for DISK_CACHE_SECONDS)"""
+    now = time.monotonic()
+    cached = disk_cache.get(path)
+    if cached is not None and now - cached[0] < DISK_CACHE_SECONDS:
+        return cached[1]
+    
     try:
         disk = psutil.disk_usage(path)
-        return disk.percent, disk.used / (1024**3), disk.total / (1024**3)
+        usage = (disk.percent, disk.used / (1024**3), disk.total / (1024**3))
     except Exception:
-        return None, None, None
+        usage = (None, None, None)
+    disk_cache[path] = (now, usage)
+    return usage
 
 def get_memory_usage():
-    """Get memory usage"""
-    mem = psutil.virtual_memory()
-    return mem.percent, mem.used / (1024**3), mem.total / (1024**3)
+    """Get memory usage from /proc/meminfo (used = total - available)"""
+    proc_meminfo.seek(0)
+    total = available = 0
+    for line in proc_meminfo.read().splitlines():
+        if line.startswith(b'MemTotal:'):
+            total = int(line.split()[1]) * 1024
+        elif line.startswith(b'MemAvailable:'):
+            available = int(line.split()[1]) * 1024
+            break
+    used = total - available
+    return used / total * 100, used / (1024**3), total / (1024**3)
 
 def get_cpu_temp():
     """Get CPU temperature"""
@@ -110,44 +241,86 @@ def get_cpu_temp():
         return None
 
 def get_cpu_usage():
-    """Get CPU usage percentage"""
-    return psutil.cpu_percent(interval=0.1)
+    """Get CPU usage percentage since the previous call from /proc/stat"""
+    global last_cpu_times
+    
+    proc_stat.seek(0)
+    # cpu user nice system idle iowait irq softirq steal ...
+    fields = proc_stat.read(512).split(b'\n', 1)[0].split()
+    times = [int(x) for x in fields[1:9]]
+    
+    usage = 0.0
+    if last_cpu_times is not None:
+        # Counters such as iowait can step backwards, so clamp each delta
+        deltas = [max(now - before, 0) for now, before in zip(times, last_cpu_times)]
+        total_delta = sum(deltas)
+        idle_delta = deltas[3] + deltas[4]
+        if total_delta > 0:
+            usage = min(max((total_delta - idle_delta) / total_delta * 100, 0.0), 100.0)
+    last_cpu_times = times
+    return usage
+
+# Prime the CPU counters so the first reading is meaningful
+get_cpu_usage()
+
+def get_net_bytes():
+    """Get total bytes sent and received on all interfaces from /proc/net/dev"""
+    proc_net_dev.seek(0)
+    sent = recv = 0
+    # Skip the two header lines, then "iface: rx_bytes ... tx_bytes ..."
+    for line in proc_net_dev.read().splitlines()[2:]:
+        fields = line.split(b':', 1)[1].split()
+        recv += int(fields[0])
+        sent += int(fields[8])
+    return sent, recv
 
 def get_network_usage():
     """Get network usage in KB/s"""
-    global last_net_io
-    
     try:
-        net_io = psutil.net_io_counters()
+        total_sent, total_recv = get_net_bytes()
         current_time = time.time()
         
-        if last_net_io is not None:
-            bytes_sent = net_io.bytes_sent - last_net_io['bytes_sent']
-            bytes_recv = net_io.bytes_recv - last_net_io['bytes_recv']
-            time_delta = current_time - last_net_io['time']
+        kb_per_sec = 0
+        if last_net_io.time is not None:
+            bytes_sent = total_sent - last_net_io.sent
+            bytes_recv = total_recv - last_net_io.recv
+            time_delta = current_time - last_net_io.time
             
             if time_delta > 0:
                 kb_per_sec = (bytes_sent + bytes_recv) / 1024 / time_delta
-                last_net_io = {
-                    'bytes_sent': net_io.bytes_sent,
-                    'bytes_recv': net_io.bytes_recv,
-                    'time': current_time
-                }
-                return kb_per_sec
         
-        last_net_io = {
-            'bytes_sent': net_io.bytes_sent,
-            'bytes_recv': net_io.bytes_recv,
-            'time': current_time
-        }
-        return 0
+        last_net_io.sent = total_sent
+        last_net_io.recv = total_recv
+        last_net_io.time = current_time
+        return kb_per_sec
     except Exception:
         return 0
 
+class Backlight:
+    """Backlight color that is only pushed to the SN3218 when it changed"""
+    
+    def __init__(self):
+        self.color = None
+        self._dirty = False
+    
+    def set(self, r, g, b):
+        """Remember the color, pushed on the next flush"""
+        if (r, g, b) != self.color:
+            self.color = (r, g, b)
+            self._dirty = True
+    
+    def flush(self):
+        """Push the color to the SN3218 if it changed"""
+        if self._dirty:
+            backlight.set_all(*self.color)
+            backlight.show()
+            self._dirty = False
+
+display_backlight = Backlight()
+
 def set_backlight():
-    """Set the backlight to white"""
-    backlight.set_all(*BACKLIGHT_COLOR)
-    backlight.show()
+    """Set the backlight to white (sent on the next flush)"""
+    display_backlight.set(*BACKLIGHT_COLOR)
 
 def draw_page_0(draw, font):
     """Page 1: IP, Copyparty status, Time/Date"""
@@ -156,11 +329,11 @@ def draw_page_0(draw, font):
     now = datetime.now()
     
     # IP address
-    draw.text((2, 2), f"IP: {ip}", font=font, fill=1)
+    draw.text((label_ends["IP: "], 2), ip, font=font, fill=1)
     
     # Copyparty status
     status = f"Port {COPYPARTY_PORT}" if copyparty_status else "Stopped"
-    draw.text((2, 18), f"Copyparty: {status}", font=font, fill=1)
+    draw.text((label_ends["Copyparty: "], 18), status, font=font, fill=1)
     
     # Time
     time_str = now.strftime("%H:%M:%S")
@@ -170,114 +343,240 @@ def draw_page_0(draw, font):
     date_str = now.strftime("%Y-%m-%d")
     draw.text((2, 50), date_str, font=font, fill=1)
 
+# Values are rounded to display precision before formatting, so on a
+# steady system these return cached strings
+@functools.lru_cache(maxsize=32)
+def format_usage(pct, used, total):
+    """Format usage as 'pct% (used/totalGB)'"""
+    return f"{pct:.0f}% ({used:.1f}/{total:.1f}GB)"
+
+@functools.lru_cache(maxsize=32)
+def format_percent(pct):
+    """Format a percentage with no decimals"""
+    return f"{pct:.0f}%"
+
+@functools.lru_cache(maxsize=32)
+def format_capacity(used, total):
+    """Format capacity as 'used/totalGB' with no decimals"""
+    return f"{used:.0f}/{total:.0f}GB"
+
 def draw_page_1(draw, font):
     """Page 2: SD card, NVMe storage, RAM"""
     # SD Card (root filesystem)
     sd_pct, sd_used, sd_total = get_disk_usage('/')
     if sd_pct is not None:
-        draw.text((2, 2), f"SD: {sd_pct:.0f}% ({sd_used:.1f}/{sd_total:.1f}GB)", font=font, fill=1)
+        draw.text((label_ends["SD: "], 2), format_usage(round(sd_pct), round(sd_used, 1), round(sd_total, 1)), font=font, fill=1)
     
     # NVMe Storage
     nvme_pct, nvme_used, nvme_total = get_disk_usage('/mnt/storage')
     if nvme_pct is not None:
-        draw.text((2, 18), f"NVMe: {nvme_pct:.0f}%", font=font, fill=1)
-        draw.text((2, 34), f"{nvme_used:.0f}/{nvme_total:.0f}GB", font=font, fill=1)
+        draw.text((label_ends["NVMe: "], 18), format_percent(round(nvme_pct)), font=font, fill=1)
+        draw.text((2, 34), format_capacity(round(nvme_used), round(nvme_total)), font=font, fill=1)
     else:
-        draw.text((2, 18), "NVMe: N/A", font=font, fill=1)
+        draw.text((label_ends["NVMe: "], 18), "N/A", font=font, fill=1)
     
     # RAM
     mem_pct, mem_used, mem_total = get_memory_usage()
-    draw.text((2, 50), f"RAM: {mem_pct:.0f}% ({mem_used:.1f}/{mem_total:.1f}GB)", font=font, fill=1)
+    draw.text((label_ends["RAM: "], 50), format_usage(round(mem_pct), round(mem_used, 1), round(mem_total, 1)), font=font, fill=1)
+
+def column_masks(y_top, y_bottom):
+    """(page offset, byte mask) pairs covering pixels y_top..y_bottom of a column"""
+    masks = []
+    for page in range(y_top // 8, y_bottom // 8 + 1):
+        top = max(y_top - page * 8, 0)
+        bottom = min(y_bottom - page * 8, 7)
+        masks.append((page * WIDTH, (0xff >> (7 - bottom)) & (0xff << top)))
+    return tuple(masks)
+
+@functools.lru_cache(maxsize=None)
+def bar_masks(y_start, height):
+    """Lookup table of column masks for every possible bar height of a graph"""
+    y_bottom = y_start + height - 2
+    return tuple(
+        column_masks(y_bottom - bar_height + 1, y_bottom) if bar_height else ()
+        for bar_height in range(height - 1)
+    )
+
+def blit_text(framebuffer, xy, text, font):
+    """OR a line of text into the framebuffer at (x, y)"""
+    x, y = xy
+    page = y // 8
+    
+    # Render into a two page strip, then OR the packed bytes in
+    strip = Image.new('1', (WIDTH, 16), 0)
+    ImageDraw.Draw(strip).text((x, y % 8), text, font=font, fill=1)
+    packed = np.frombuffer(pack_framebuffer(strip), dtype=np.uint8)
+    
+    offset = page * WIDTH
+    length = min(len(packed), len(framebuffer) - offset)
+    np.frombuffer(framebuffer, dtype=np.uint8)[offset:offset + length] |= packed[:length]
 
-def draw_graph(draw, data, y_start, height, max_value=100):
-    """Draw a horizontal graph"""
+def draw_graph(framebuffer, data, y_start, height, max_value=100):
+    """Draw a horizontal graph (the border comes from the page background)"""
     if len(data) == 0:
         return
     
-    # Draw graph border
-    draw.rectangle([(0, y_start), (WIDTH-1, y_start + height - 1)], outline=1, fill=0)
-    
-    # Draw graph data
-    for x, value in enumerate(data):
-        if value > 0:
-            # Scale value to graph height
-            bar_height = int((value / max_value) * (height - 2))
-            bar_height = min(bar_height, height - 2)
-            if bar_height > 0:
-                y_bottom = y_start + height - 2
-                y_top = y_bottom - bar_height
-                draw.line([(x + 1, y_top), (x + 1, y_bottom)], fill=1)
-
-def draw_page_2(draw, font):
+    # Newest samples that fit inside the border, one per column
+    inner_width = WIDTH - 2
+    inner_height = height - 2
+    values = data[-inner_width:].astype(np.int32)
+    
+    # Scale values to graph height
+    bar_heights = (values * inner_height // max_value).clip(0, inner_height)
+    
+    # Each bar is a table lookup plus one OR per page it spans
+    masks = bar_masks(y_start, height)
+    for x, bar_height in enumerate(bar_heights.tolist(), 1 + inner_width - len(values)):
+        for offset, mask in masks[bar_height]:
+            framebuffer[offset + x] |= mask
+
+def draw_page_2(framebuffer):
     """Page 3: CPU and Network graphs"""
+    global history_head
+    
     # Update graph data
     cpu_usage = get_cpu_usage()
     cpu_temp = get_cpu_temp()
-    cpu_history.append(cpu_usage)
     
     net_usage = get_network_usage()
     # Scale network to reasonable range (0-1000 KB/s = 0-100%)
     net_scaled = min((net_usage / 1000) * 100, 100)
-    net_history.append(net_scaled)
     
-    # Small font for labels
-    try:
-        small_font = ImageFont.truetype(fonts.BitbuntuFull, 8)
-    except Exception:
-        small_font = font
+    # Clamp to the uint8 history range, counters can step backwards
+    cpu_history[history_head] = min(max(int(cpu_usage), 0), 100)
+    net_history[history_head] = min(max(int(net_scaled), 0), 100)
+    history_head = (history_head + 1) % WIDTH
     
     # CPU Graph (top half) - added spacing and temperature
     if cpu_temp:
-        draw.text((2, 0), f"CPU {cpu_usage:.0f}% {cpu_temp:.0f}C", font=small_font, fill=1)
+        blit_text(framebuffer, (label_ends["CPU "], 0), f"{cpu_usage:.0f}% {cpu_temp:.0f}C", SMALL_FONT)
     else:
-        draw.text((2, 0), f"CPU {cpu_usage:.0f}%", font=small_font, fill=1)
-    draw_graph(draw, cpu_history, 12, 20)
+        blit_text(framebuffer, (label_ends["CPU "], 0), f"{cpu_usage:.0f}%", SMALL_FONT)
+    draw_graph(framebuffer, np.roll(cpu_history, -history_head), *CPU_GRAPH)
     
     # Network Graph (bottom half) - added spacing
-    draw.text((2, 34), f"NET {net_usage:.0f}KB/s", font=small_font, fill=1)
-    draw_graph(draw, net_history, 46, 18)
+    blit_text(framebuffer, (label_ends["NET "], 34), f"{net_usage:.0f}KB/s", SMALL_FONT)
+    draw_graph(framebuffer, np.roll(net_history, -history_head), *NET_GRAPH)
 
-def update_display():
-    """Update the display with current page"""
-    # Create image buffer
-    image = Image.new('P', (WIDTH, HEIGHT))
-    draw = ImageDraw.Draw(image)
+def build_page_backgrounds():
+    """Render the static labels and graph borders of every page once"""
+    global graph_page_framebuffer
     
-    # Load font
-    try:
-        font = ImageFont.truetype(fonts.BitbuntuFull, FONT_SIZE)
-    except Exception:
-        font = ImageFont.load_default()
-    
-    # Draw the current page
-    if current_page == 0:
-        draw_page_0(draw, font)
-    elif current_page == 1:
-        draw_page_1(draw, font)
-    elif current_page == 2:
-        draw_page_2(draw, font)
-    
-    # Convert image for display
-    for x in range(WIDTH):
-        for y in range(HEIGHT):
-            pixel = image.getpixel((x, y))
-            lcd.set_pixel(x, y, pixel)
+    page_backgrounds.clear()
+    for labels in PAGE_LABELS:
+        background = Image.new('1', (WIDTH, HEIGHT), 0)
+        draw = ImageDraw.Draw(background)
+        for (x, y), text, small in labels:
+            label_font = SMALL_FONT if small else FONT
+            draw.text((x, y), text, font=label_font, fill=1)
+            label_ends[text] = x + int(draw.textlength(text, font=label_font))
+        page_backgrounds.append(background)
     
-    lcd.show()
+    # Graph borders on page 3
+    draw = ImageDraw.Draw(page_backgrounds[2])
+    for y_start, height in (CPU_GRAPH, NET_GRAPH):
+        draw.rectangle([(0, y_start), (WIDTH-1, y_start + height - 1)], outline=1, fill=0)
+    graph_page_framebuffer = pack_framebuffer(page_backgrounds[2])
+
+def pack_pages(pixels, out):
+    """Pack pixel rows into ST7567 pages (compiled with Numba when available)"""
+    height, width = pixels.shape
+    for page in range(height // 8):
+        for x in range(width):
+            b = 0
+            for bit in range(8):
+                if pixels[page * 8 + bit, x]:
+                    b |= 1 << bit
+            out[page * width + x] = b
+
+if njit is not None:
+    pack_pages = njit(cache=True)(pack_pages)
+
+def pack_framebuffer(image):
+    """Pack an image into ST7567 page layout (8 vertical pixels per byte, LSB on top)"""
+    pixels = np.asarray(image)
+    height, width = pixels.shape
+    if njit is None:
+        pages = pixels.reshape(height // 8, 8, width)
+        return np.packbits(pages, axis=1, bitorder='little').tobytes()
+    
+    out = np.empty((height // 8) * width, dtype=np.uint8)
+    pack_pages(pixels, out)
+    return out.tobytes()
+
+def push_framebuffer(framebuffer):
+    """Send only the changed column span of each LCD page over SPI
+    
+    This is the only LCD transfer per refresh; backlight changes are
+    flushed right after it from the main loop.
+    """
+    global last_framebuffer
+    
+    if last_framebuffer is None:
+        lcd.st7567.buf[:] = framebuffer
+        lcd.show()
+        last_framebuffer = framebuffer
+        return
+    
+    diff = np.frombuffer(framebuffer, dtype=np.uint8) ^ np.frombuffer(last_framebuffer, dtype=np.uint8)
+    changed = np.flatnonzero(diff)
+    if len(changed) == 0:
+        return
+    
+    lcd.st7567.buf[:] = framebuffer
+    st7567 = lcd.st7567
+    st7567.setup()
+    pages = changed // WIDTH
+    for page in np.unique(pages):
+        columns = changed[pages == page] % WIDTH
+        start, end = int(columns[0]), int(columns[-1]) + 1
+        offset = int(page) * WIDTH
+        st7567._command([ST7567_SETPAGESTART | int(page), ST7567_SETCOLL | (start & 0x0f), ST7567_SETCOLH | (start >> 4)])
+        st7567._data(list(framebuffer[offset + start:offset + end]))
+    last_framebuffer = framebuffer
+
+def make_renderer(page):
+    """Build the render function of a page with its background and drawing bound"""
+    if page == 2:
+        # The graph page is rasterized straight into the framebuffer
+        background = graph_page_framebuffer
+        draw_page = draw_page_2
+        
+        def render():
+            framebuffer = bytearray(background)
+            draw_page(framebuffer)
+            return framebuffer
+        return render
+    
+    background = page_backgrounds[page]
+    draw_page = (draw_page_0, draw_page_1)[page]
+    font = FONT
+    new_draw = ImageDraw.Draw
+    pack = pack_framebuffer
+    
+    def render():
+        image = background.copy()
+        draw_page(new_draw(image), font)
+        return pack(image)
+    return render
+
+def update_display():
+    """Update the display with current page"""
+    push_framebuffer(page_renderers[current_page]())
 
 def next_page(ch, event):
     """Go to next page"""
     global current_page
     if event == 'press':
         current_page = (current_page + 1) % total_pages
-        update_display()
+        os.write(wake_write, b'\0')
 
 def prev_page(ch, event):
     """Go to previous page"""
     global current_page
     if event == 'press':
         current_page = (current_page - 1) % total_pages
-        update_display()
+        os.write(wake_write, b'\0')
 
 def main():
     """Main loop"""
@@ -290,6 +589,14 @@ def main():
     lcd.clear()
     lcd.show()
     
+    # Render the static parts of every page and bind the page renderers
+    build_page_backgrounds()
+    page_renderers[:] = [make_renderer(page) for page in range(total_pages)]
+    
+    # Wake up on button presses or when the next refresh is due
+    selector = selectors.DefaultSelector()
+    selector.register(wake_read, selectors.EVENT_READ)
+    
     # Set up button handlers
     touch.on(3, prev_page)    # - button
     touch.on(5, next_page)    # + button
@@ -297,20 +604,29 @@ def main():
     # Set backlight to white
     set_backlight()
     
-    # Initial display
-    update_display()
+    last_update = None
     
     try:
         # Update loop
         while True:
+            if last_update is not None:
+                if current_page == 0:
+                    # Wake at the next wall-clock second so the clock never lags or skips
+                    timeout = 1 - (time.time() % 1)
+                else:
+                    next_update = last_update + PAGE_REFRESH_SECONDS[current_page]
+                    timeout = max(0, next_update - time.monotonic())
+                if selector.select(timeout):
+                    os.read(wake_read, 64)
+            last_update = time.monotonic()
             update_display()
-            time.sleep(2)  # Update every 2 seconds
+            display_backlight.flush()
     except KeyboardInterrupt:
         print("\nExiting...")
         lcd.clear()
         lcd.show()
-        backlight.set_all(0, 0, 0)
-        backlight.show()
+        display_backlight.set(0, 0, 0)
+        display_backlight.flush()
 
 if __name__ == "__main__":
     main()
@@ -5,7 +5,8 @@ echo "Installing GFX HAT System Stats Display..."
 
 # Install required Python packages
 echo "Installing Python dependencies..."
-pip3 install --user psutil Pillow
+pip3 install --user psutil Pillow numpy
+# Optional: pip3 install --user numba (faster framebuffer packing)
 
 # Install GFX HAT library if not already installed
 if ! python3 -c "import gfxhat" 2>/dev/null; then